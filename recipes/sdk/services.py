@@ -1,9 +1,12 @@
 import logging
 import os
+from types import MappingProxyType
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 from sdk.errors import DataAggregatorHTTPError, JiraHTTPError, JiraParsingError
 from sdk.incident import Incident
@@ -14,16 +17,41 @@ logger = logging.getLogger(__name__)
 class HTTPService:
     """Interface for an HTTP Service."""
 
+    HEADERS = MappingProxyType(
+        {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+    )
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 64
+    RETRIES = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+
     def __init__(self, url):
         self.session = requests.Session()
+        self.session.headers.update(self.get_headers())
+        self._mount_adapter()
         self.url = url
 
+    def _mount_adapter(self):
+        """Mount a pooled HTTP adapter with retries on the session."""
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=self.RETRIES,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def get_headers(self):
         """Get HTTP headers."""
-        return {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        return self.HEADERS
 
     def get(self, url, params=None, auth=None):
         """Send a GET request."""
@@ -31,7 +59,6 @@ class HTTPService:
             response = self.session.get(
                 url,
                 params=params,
-                headers=self.get_headers(),
                 auth=auth,
             )
             response.raise_for_status()
@@ -47,7 +74,6 @@ class HTTPService:
                 url,
                 params=params,
                 json=body,
-                headers=self.get_headers(),
                 auth=auth,
             )
             response.raise_for_status()
@@ -67,12 +93,15 @@ class Jira(HTTPService):
     }
 
     def __init__(self, url=None):
-        self._load_environment_variables()
-        super().__init__(url or self.url)
+        self._load_environment_variables(url)
+        super().__init__(self.url)
+        parsed_url = urlparse(self.url)
+        self._base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        self._board_url = f"{self._base_url}/rest/agile/1.0/board"
 
-    def _load_environment_variables(self):
+    def _load_environment_variables(self, url=None):
         """Load environment variables."""
-        self.url = os.getenv("JIRA_URL")
+        self.url = url or os.getenv("JIRA_URL")
         self.user = os.getenv("JIRA_USER")
         self.token = os.getenv("JIRA_TOKEN")
         if not self.url or not self.user or not self.token:
@@ -86,15 +115,12 @@ class Jira(HTTPService):
 
     def get_issue_url(self, project_key: str, issue_key: str):
         """Get the URL for a Jira issue."""
-        parsed_url = urlparse(self.url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-
-        board_url = f"{base_url}/rest/agile/1.0/board?projectKeyOrId={project_key}"
-        board_details = self.get(board_url, auth=self.get_auth())
+        params = {"projectKeyOrId": project_key}
+        board_details = self.get(self._board_url, params=params, auth=self.get_auth())
 
         board_id = board_details["values"][0]["id"]
         issue = f"?selectedIssue={issue_key}"
-        return f"{base_url}/jira/software/projects/{project_key}/boards/{board_id}/{issue}"
+        return f"{self._base_url}/jira/software/projects/{project_key}/boards/{board_id}/{issue}"
 
     def create_issue(self, data: dict):
         """Create a Jira issue."""
@@ -136,7 +162,7 @@ class DataAggregator(HTTPService):
     """Interface for the Thalia Data Aggregator."""
 
     URL = "http://localhost:8080"
-    SOURCES = {"grafana", "prometheus", "influxdb", "opensearch"}
+    SOURCES = frozenset(("grafana", "prometheus", "influxdb", "opensearch"))
 
     def __init__(self, aggregator_address):
         super().__init__(url=(aggregator_address or self.URL))
@@ -144,33 +170,28 @@ class DataAggregator(HTTPService):
 
     def get_source_url(self, source):
         """Get the base URL for a data source."""
-        if source not in self.SOURCES:
-            raise ValueError(f"Invalid source: '{source}'. Valid sources are: {self.SOURCES}")
-        return self.sources[source]
+        try:
+            return self.sources[source]
+        except KeyError:
+            raise ValueError(
+                f"Invalid source: '{source}'. Valid sources are: {sorted(self.SOURCES)}"
+            ) from None
 
-    def post(self, args, **kwargs):
+    def post(self, url, **kwargs):
         """Send a POST request to the Data Aggregator service and handle errors."""
         try:
-            res = super().post(args, **kwargs)
+            return super().post(url, **kwargs)
         except requests.exceptions.RequestException as e:
             raise DataAggregatorHTTPError(e)
-        return res
-
-    def _get_grafana_dashboard_from_url(self, url: str):
-        """Get a Grafana dashboard ID from a URL."""
-        return url.rsplit("/", 1)[-1].split("?")[0]
-
-    def _get_grafana_panel_from_url(self, url: str):
-        """Get a Grafana panel ID from a URL."""
-        return url.rsplit("=", 1)[-1]
 
     def _get_grafana_dashboard_and_panel(self, data: dict):
         """Get the Grafana dashboard and specific panel from the input data."""
         alert = data.get("alert")
-        dashboard_id = alert.get("dahsboard_id") or self._get_grafana_dashboard_from_url(
-            alert["dashboardURL"]
-        )
-        panel_id = alert.get("panel_id") or self._get_grafana_panel_from_url(alert["panelURL"])
+        dashboard_id = alert.get("dahsboard_id")
+        if not dashboard_id:
+            last_segment = alert["dashboardURL"].rpartition("/")[2]
+            dashboard_id = last_segment.partition("?")[0]
+        panel_id = alert.get("panel_id") or alert["panelURL"].rpartition("=")[2]
         return dashboard_id, panel_id
 
     def get_grafana_dashboard_from_incident(self, incident: Incident):
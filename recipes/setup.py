@@ -8,6 +8,7 @@ setup(
         "requests",
         "redis",
         "tenacity",
+        "urllib3",
     ],
     entry_points={
         "console_scripts": [